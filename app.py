@@ -9,11 +9,12 @@ import yfinance as yf
 import plotly.graph_objs as go
 import pandas as pd
 from datetime import date
-from typing import Optional, Tuple, List, Dict
-from src.stock_events import get_stock_events
+from typing import Optional, Tuple, List, Dict, Final
+from src.stock_events import get_stock_events_many
 from src.i18n import t, LANGUAGES
 from src.indicators import (
-    add_stochastic, add_atr, add_vwap, add_ichimoku, add_user_indicator, add_sma, add_ema, add_bollinger, add_rsi, add_macd
+    add_stochastic, add_atr, add_vwap, add_ichimoku, add_user_indicator, add_sma, add_ema, add_bollinger,
+    add_rsi_many, add_macd_many
 )
 from src.data_fetching.historical_data import fetch_stock_data_multi_timeframe
 from src.data_fetching.live_data import fetch_live_data
@@ -21,6 +22,14 @@ from src.dashboard import set_page_config, select_language, setup_autorefresh, d
 from src.visualization import create_volume_chart, add_macd_chart, add_rsi_chart, create_price_chart, display_key_metrics
 from src.portfolio import create_portfolio_section
 
+# Multi-timeframe support: maps the form's timeframe to a yfinance interval.
+INTERVAL_MAP: Final[Dict[str, str]] = {
+    "Daily": "1d",
+    "Weekly": "1wk",
+    "Monthly": "1mo",
+    "Intraday": "15m"
+}
+
 
 def main():
     # --- Real-Time & Intraday Data ---
@@ -39,25 +48,27 @@ def main():
     ticker_input, start_date, end_date, indicator, chart_type, submitted, timeframe, overlay = stock_form_ui(lang)
 
     if submitted or timeframe == "Intraday" or st.session_state['portfolio']:
-        # Parse tickers
-        tickers = [t.strip() for t in ticker_input.replace(',', ' ').split() if t.strip()]
+        # Parse tickers, memoized on the raw input string so the 10 s
+        # autorefresh reruns don't redo the string manipulation.
+        if st.session_state.get('_ticker_key') != ticker_input:
+            st.session_state['_ticker_key'] = ticker_input
+            st.session_state['_tickers'] = [t.strip() for t in ticker_input.replace(',', ' ').split() if t.strip()]
+        tickers = st.session_state['_tickers']
         # Portfolio tickers
         port_tickers = [item['ticker'] for item in st.session_state['portfolio']]
-        # Multi-timeframe support
-        interval_map = {
-            "Daily": "1d",
-            "Weekly": "1wk",
-            "Monthly": "1mo",
-            "Intraday": "15m"
-        }
-        interval = interval_map.get(timeframe, "1d")
+        interval = INTERVAL_MAP.get(timeframe, "1d")
         
+        # Fetch the union of form and portfolio tickers once, then slice the
+        # result per consumer, so overlapping symbols are downloaded once.
+        form_syms = [t.upper().strip() for t in tickers]
+        port_syms = [t.upper().strip() for t in port_tickers]
+        all_syms = sorted(set(form_syms) | set(port_syms))
         if timeframe == "Intraday":
-            data = fetch_live_data(tickers, interval="1m")
-            port_data = fetch_live_data(port_tickers, interval="1m") if port_tickers else {}
+            all_data = fetch_live_data(all_syms, interval="1m")
         else:
-            data = fetch_stock_data_multi_timeframe(tickers, start_date, end_date, interval)
-            port_data = fetch_stock_data_multi_timeframe(port_tickers, start_date, end_date, interval) if port_tickers else {}
+            all_data = fetch_stock_data_multi_timeframe(all_syms, start_date, end_date, interval)
+        data = {s: all_data[s] for s in form_syms if s in all_data}
+        port_data = {s: all_data[s] for s in port_syms if s in all_data}
         
         if not data and not port_data:
             st.error(t("error_no_data", lang))
@@ -71,35 +82,50 @@ def main():
             # --- Download Buttons ---
             display_download_buttons(data=data, metrics_df=metrics_df, lang=lang)
 
-        # --- Customizable Chart: Closing Prices + Indicators ---
-        create_price_chart(
-            data=data,
-            chart_type=chart_type if chart_type in ["Line", "Candlestick", "Area"] else "Line",
-            indicator=indicator,
-            overlay=overlay,
-            start_date=str(start_date),
-            end_date=str(end_date),
-            add_sma=add_sma,
-            add_ema=add_ema,
-            add_bollinger=add_bollinger,
-            add_stochastic=add_stochastic,
-            add_atr=add_atr,
-            add_vwap=add_vwap,
-            add_ichimoku=add_ichimoku,
-            add_user_indicator=add_user_indicator,
-            get_stock_events=get_stock_events
-        )
-
-        # --- RSI Chart ---
-        if indicator == "RSI (14)":
-            add_rsi_chart(data=data, add_rsi=add_rsi)
-
-        # --- MACD Chart ---
-        if indicator == "MACD":
-            add_macd_chart(data=data, add_macd=add_macd)
-
-        # --- Volume Chart: Trading Volume (Stacked) ---
-        create_volume_chart(data=data)
+        # Skip chart rebuilding when only the autorefresh fired: if no input
+        # bit changed since the last render (and we're not on live intraday
+        # data), replay the cached figures instead of recomputing indicators,
+        # events, and traces.
+        render_key = (tuple(all_syms), str(start_date), str(end_date), interval, indicator, chart_type, overlay)
+        cached = st.session_state.get('_fig_cache') if timeframe != "Intraday" else None
+        if cached is not None and cached['key'] == render_key:
+            for fig in cached['figs']:
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            figs = []
+
+            # --- Customizable Chart: Closing Prices + Indicators ---
+            figs.append(create_price_chart(
+                data=data,
+                chart_type=chart_type if chart_type in ["Line", "Candlestick", "Area"] else "Line",
+                indicator=indicator,
+                overlay=overlay,
+                start_date=str(start_date),
+                end_date=str(end_date),
+                add_sma=add_sma,
+                add_ema=add_ema,
+                add_bollinger=add_bollinger,
+                add_stochastic=add_stochastic,
+                add_atr=add_atr,
+                add_vwap=add_vwap,
+                add_ichimoku=add_ichimoku,
+                add_user_indicator=add_user_indicator,
+                get_stock_events_many=get_stock_events_many
+            ))
+
+            # --- RSI Chart ---
+            if indicator == "RSI (14)":
+                figs.append(add_rsi_chart(data=data, add_rsi_many=add_rsi_many))
+
+            # --- MACD Chart ---
+            if indicator == "MACD":
+                figs.append(add_macd_chart(data=data, add_macd_many=add_macd_many))
+
+            # --- Volume Chart: Trading Volume (Stacked) ---
+            figs.append(create_volume_chart(data=data))
+
+            if timeframe != "Intraday":
+                st.session_state['_fig_cache'] = {'key': render_key, 'figs': figs}
 
 
 if __name__ == "__main__":
@@ -11,6 +11,24 @@ from typing import Dict, List, Tuple, Any
 from src.i18n import t, LANGUAGES
 
 
+@st.cache_data(show_spinner=False)
+def _history_csv(hist: pd.DataFrame) -> bytes:
+    """
+    Serialize a history DataFrame to CSV once per distinct frame.
+
+    CSV encoding of multi-year histories is the dominant CPU cost of the
+    download section; caching it means re-renders with unchanged data skip
+    the pandas serializer entirely.
+    """
+    return hist.to_csv().encode('utf-8')
+
+
+@st.cache_data(show_spinner=False)
+def _metrics_csv(metrics_df: pd.DataFrame) -> bytes:
+    """Serialize the key-metrics table to CSV once per distinct frame."""
+    return metrics_df.to_csv(index=False).encode('utf-8')
+
+
 def set_page_config(lang: str) -> None:
     """
     Set Streamlit page configuration and title.
@@ -68,37 +86,21 @@ def display_download_buttons(data: Dict[str, pd.DataFrame], metrics_df: pd.DataF
     st.markdown(f"### {t('download_data', lang)}")
     # Prepare download buttons (key metrics + each ticker's historical data)
     download_buttons = []
-    csv_metrics = metrics_df.to_csv(index=False).encode('utf-8')
-    download_buttons.append({
-        "label": t("download_key_metrics", lang),
-        "data": csv_metrics,
-        "file_name": "key_metrics.csv",
-        "mime": "text/csv",
-        "key": "download_key_metrics_1"
-    })
     download_buttons.append({
         "label": t("download_key_metrics", lang),
-        "data": csv_metrics,
+        "data": _metrics_csv(metrics_df),
         "file_name": "key_metrics.csv",
         "mime": "text/csv",
-        "key": "download_key_metrics_2"
+        "key": "download_key_metrics"
     })
-    
+
     for ticker, hist in data.items():
-        csv_hist = hist.to_csv().encode('utf-8')
-        download_buttons.append({
-            "label": t("download_history", lang, ticker=ticker),
-            "data": csv_hist,
-            "file_name": f"{ticker}_history.csv",
-            "mime": "text/csv",
-            "key": f"download_{ticker}_history_1"
-        })
         download_buttons.append({
             "label": t("download_history", lang, ticker=ticker),
-            "data": csv_hist,
+            "data": _history_csv(hist),
             "file_name": f"{ticker}_history.csv",
             "mime": "text/csv",
-            "key": f"download_{ticker}_history_2"
+            "key": f"download_{ticker}_history"
         })
 
     # Display buttons in rows of max 3 per row
@@ -174,21 +176,32 @@ def stock_form_ui(lang: str) -> Tuple[str, date, date, str, str, bool, str, str]
             ]
         )
         
-        # Multi-timeframe: show translated labels, use English for logic
+        # Multi-timeframe: show translated labels, use English for logic.
+        # The label->English maps live in session_state so each rerun does a
+        # single O(1) dict lookup instead of a linear .index() search. Note
+        # the membership guard: setdefault would still evaluate the dict
+        # comprehension (and its t() calls) on every rerun before discarding
+        # it, so the build has to sit behind an explicit `in` check.
         timeframe_options = ["Daily", "Weekly", "Monthly", "Intraday"]
-        timeframe_labels = [t(opt, lang) for opt in timeframe_options]
-        timeframe_label = st.selectbox("Timeframe", options=timeframe_labels, index=0)
-        
-        # Map back to English value for logic
-        timeframe = timeframe_options[timeframe_labels.index(timeframe_label)]
+        tf_key = f'_tf_labels_{lang}'
+        if tf_key not in st.session_state:
+            st.session_state[tf_key] = {t(opt, lang): opt for opt in timeframe_options}
+        label_to_timeframe = st.session_state[tf_key]
+        timeframe_label = st.selectbox("Timeframe", options=list(label_to_timeframe), index=0)
+        timeframe = label_to_timeframe[timeframe_label]
         overlay = st.text_input(
             "Custom Overlay (pandas formula, e.g. 'Close.rolling(10).mean()')",
             value=""
         )
-        chart_type = st.selectbox(
-            t("chart_type", lang),
-            [t("line", lang), t("candlestick", lang), t("area", lang)]
-        )
+        chart_key = f'_chart_labels_{lang}'
+        if chart_key not in st.session_state:
+            st.session_state[chart_key] = {
+                t(key, lang): name for key, name in
+                (("line", "Line"), ("candlestick", "Candlestick"), ("area", "Area"))
+            }
+        label_to_chart_type = st.session_state[chart_key]
+        chart_label = st.selectbox(t("chart_type", lang), options=list(label_to_chart_type))
+        chart_type = label_to_chart_type[chart_label]
         submitted = st.form_submit_button(t("submit", lang))
 
     return ticker_input, start_date, end_date, indicator, chart_type, submitted, timeframe, overlay
@@ -0,0 +1,82 @@
+"""
+file_cache.py
+Persistent on-disk cache for historical fetch results.
+
+st.cache_data lives in process memory, so a Streamlit worker restart loses it
+and identical queries re-hit Yahoo (and its rate limits). This cache stores
+each fetched ticker as parquet under a key derived from the query, with a
+sidecar JSON holding the write timestamp. Closed date ranges (end before
+today) are immutable and kept for days; ranges that include today expire
+quickly so the current bar stays fresh.
+"""
+
+import hashlib
+import json
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+CACHE_DIR = Path("cache")
+
+# A range that ended before today can never change; today's range can.
+CLOSED_RANGE_TTL = 90 * 24 * 3600
+OPEN_RANGE_TTL = 60
+
+
+def _cache_key(tickers: List[str], start: date, end: date, interval: str) -> str:
+    """Stable key for a query: sorted tickers plus range and interval."""
+    raw = f"{sorted(tickers)}|{start}|{end}|{interval}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def load(tickers: List[str], start: date, end: date, interval: str) -> Optional[Dict[str, pd.DataFrame]]:
+    """
+    Load a cached fetch result, or None on miss, expiry, or read error.
+
+    Args:
+        tickers (List[str]): Normalized ticker symbols.
+        start (date): Start date.
+        end (date): End date.
+        interval (str): Data interval.
+
+    Returns:
+        Optional[Dict[str, pd.DataFrame]]: Cached per-ticker data, or None.
+    """
+    entry = CACHE_DIR / _cache_key(tickers, start, end, interval)
+    meta_path = entry / "meta.json"
+    try:
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text())
+        ttl = CLOSED_RANGE_TTL if str(end) < date.today().isoformat() else OPEN_RANGE_TTL
+        if time.time() - meta["timestamp"] > ttl:
+            return None
+        return {sym: pd.read_parquet(entry / f"{sym}.parquet") for sym in meta["tickers"]}
+    except Exception:
+        return None
+
+
+def store(data: Dict[str, pd.DataFrame], tickers: List[str], start: date, end: date, interval: str) -> None:
+    """
+    Persist a fetch result. Failures are swallowed: the cache is an
+    optimization, never a requirement.
+
+    Args:
+        data (Dict[str, pd.DataFrame]): Per-ticker data to persist.
+        tickers (List[str]): Normalized ticker symbols used as the query key.
+        start (date): Start date.
+        end (date): End date.
+        interval (str): Data interval.
+    """
+    entry = CACHE_DIR / _cache_key(tickers, start, end, interval)
+    try:
+        entry.mkdir(parents=True, exist_ok=True)
+        for sym, hist in data.items():
+            hist.to_parquet(entry / f"{sym}.parquet")
+        meta = {"timestamp": time.time(), "tickers": list(data)}
+        (entry / "meta.json").write_text(json.dumps(meta))
+    except Exception:
+        pass
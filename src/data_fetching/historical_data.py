@@ -1,16 +1,126 @@
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
+from src.data_fetching import file_cache
+from src.data_fetching.ticker_registry import _http_session, get_ticker
+
+# Maximum number of concurrent ticker fetches; keeps total wall time close to
+# a single round-trip instead of one round-trip per ticker.
+MAX_FETCH_WORKERS = 8
+
+
+def downcast_ohlcv(hist: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize a fetched history frame: tz-naive index, OHLC as float32,
+    Volume as int32 where it fits.
+
+    Prices fit comfortably in float32, and the indicator/metrics passes over
+    these columns are memory-bound, so halving the element size roughly
+    doubles effective cache bandwidth downstream.
+
+    Args:
+        hist (pd.DataFrame): Raw history for one ticker.
+
+    Returns:
+        pd.DataFrame: The same DataFrame with a tz-naive index and downcast
+        columns.
+    """
+    # Ticker.history returns tz-aware indexes while batched yf.download is
+    # tz-naive for daily+ intervals; dropping the zone here gives every
+    # frame the app hands around one convention, so index-aligning ops
+    # (portfolio beta against SPY, cross-ticker concats) can't raise on a
+    # naive/aware mix depending on which fetch path ran.
+    if isinstance(hist.index, pd.DatetimeIndex) and hist.index.tz is not None:
+        hist.index = hist.index.tz_localize(None)
+    for col in ('Open', 'High', 'Low', 'Close'):
+        if col in hist.columns:
+            hist[col] = hist[col].astype(np.float32, copy=False)
+    if 'Volume' in hist.columns:
+        vol = hist['Volume']
+        if vol.isna().any():
+            vol = vol.fillna(0)
+        # int32 halves the column again; heavily traded names can exceed
+        # 2^31 shares a day, so fall back to int64 when the values don't fit.
+        if not vol.empty and vol.max() <= np.iinfo(np.int32).max:
+            hist['Volume'] = vol.astype(np.int32, copy=False)
+        else:
+            hist['Volume'] = vol.astype(np.int64, copy=False)
+    return hist
+
+
+def _fetch_history(ticker: str, start: date, end: date, interval: str) -> Optional[pd.DataFrame]:
+    """
+    Fetch history for a single ticker, returning None on failure or empty data.
+
+    Args:
+        ticker (str): Uppercase stock ticker symbol.
+        start (date): Start date.
+        end (date): End date.
+        interval (str): Data interval (e.g., '1d', '1wk', '1mo').
+
+    Returns:
+        Optional[pd.DataFrame]: Historical data, or None if unavailable.
+    """
+    try:
+        hist = get_ticker(ticker).history(start=start, end=end, interval=interval)
+        return downcast_ohlcv(hist) if not hist.empty else None
+    except Exception:
+        return None
+
+
+def split_batch_download(df: pd.DataFrame, tickers: List[str]) -> Dict[str, pd.DataFrame]:
+    """
+    Split a batched yf.download result into a per-ticker dict, dropping
+    tickers that returned no rows.
+
+    Args:
+        df (pd.DataFrame): Batched download result (MultiIndex columns when
+            more than one ticker was requested).
+        tickers (List[str]): Uppercase ticker symbols that were requested.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Dictionary mapping ticker to its DataFrame.
+    """
+    data = {}
+    if df.empty:
+        return data
+    if isinstance(df.columns, pd.MultiIndex):
+        for sym in tickers:
+            if sym in df.columns.levels[0]:
+                hist = df[sym].dropna(how='all')
+                if not hist.empty:
+                    data[sym] = downcast_ohlcv(hist)
+    else:
+        hist = df.dropna(how='all')
+        if not hist.empty:
+            data[tickers[0]] = downcast_ohlcv(hist)
+    return data
+
 
 # --- Helper Functions ---
-@st.cache_data(show_spinner=True)
+def normalize_tickers(tickers: List[str]) -> Tuple[str, ...]:
+    """
+    Uppercase, deduplicate, and sort a ticker list into a canonical tuple.
+
+    Normalizing *before* the cache boundary means reordered or differently
+    cased inputs ("TSLA, aapl" vs "AAPL, TSLA") hash to the same cache entry
+    instead of each paying a fresh download.
+    """
+    return tuple(sorted({ticker.upper().strip() for ticker in tickers if ticker.strip()}))
+
+
 def fetch_stock_data_multi_timeframe(tickers: List[str], start: date, end: date, interval: str) -> Dict[str, pd.DataFrame]:
     """
     Fetch historical stock data for multiple tickers and a date range.
 
+    Thin wrapper that canonicalizes the ticker list and delegates to the
+    cached fetch, so the cache key is order- and case-insensitive.
+
     Args:
         tickers (List[str]): List of stock ticker symbols.
         start (date): Start date.
@@ -20,14 +130,39 @@ def fetch_stock_data_multi_timeframe(tickers: List[str], start: date, end: date,
     Returns:
         Dict[str, pd.DataFrame]: Dictionary mapping ticker to its DataFrame (only valid tickers).
     """
-    data = {}
-    for ticker in tickers:
-        try:
-            t = ticker.upper().strip()
-            stock = yf.Ticker(t)
-            hist = stock.history(start=start, end=end, interval=interval)
-            if not hist.empty:
-                data[t] = hist
-        except Exception:
-            continue
+    canonical = normalize_tickers(tickers)
+    if not canonical:
+        return {}
+    return _fetch_historical_cached(canonical, start, end, interval)
+
+
+# Daily/weekly/monthly bars only change once a day, so cached entries stay
+# valid for hours; the TTL mainly bounds staleness of today's partial bar.
+@st.cache_data(ttl=24 * 3600, max_entries=128, show_spinner=False)
+def _fetch_historical_cached(canonical: Tuple[str, ...], start: date, end: date, interval: str) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical data for a canonical (sorted, deduplicated, uppercase)
+    ticker tuple. All tickers go out in a single batched yf.download call;
+    if the batch call fails, falls back to per-ticker fetches through the
+    shared thread pool.
+    """
+    upper_tickers = list(canonical)
+    # On-disk cache survives worker restarts; closed historical ranges are
+    # served from parquet without touching the network at all.
+    cached = file_cache.load(upper_tickers, start, end, interval)
+    if cached is not None:
+        return cached
+    try:
+        df = yf.download(
+            upper_tickers, start=start, end=end, interval=interval,
+            group_by='ticker', threads=True, progress=False, auto_adjust=False,
+            session=_http_session()
+        )
+        data = split_batch_download(df, upper_tickers)
+    except Exception:
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(upper_tickers))) as executor:
+            results = executor.map(lambda t: (t, _fetch_history(t, start, end, interval)), upper_tickers)
+        data = {t: hist for t, hist in results if hist is not None}
+    if data:
+        file_cache.store(data, upper_tickers, start, end, interval)
     return data
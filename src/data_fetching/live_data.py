@@ -1,13 +1,41 @@
 import streamlit as st
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import yfinance as yf
 
+from src.data_fetching.historical_data import (
+    MAX_FETCH_WORKERS, downcast_ohlcv, normalize_tickers, split_batch_download
+)
+from src.data_fetching.ticker_registry import _http_session, get_ticker
+
+
+def _fetch_intraday(ticker: str, interval: str) -> Optional[pd.DataFrame]:
+    """
+    Fetch today's intraday history for a single ticker, returning None on
+    failure or empty data.
+
+    Args:
+        ticker (str): Uppercase stock ticker symbol.
+        interval (str): Data interval (e.g., '1m', '5m', '15m').
+
+    Returns:
+        Optional[pd.DataFrame]: Intraday data, or None if unavailable.
+    """
+    try:
+        hist = get_ticker(ticker).history(period="1d", interval=interval)
+        return downcast_ohlcv(hist) if not hist.empty else None
+    except Exception:
+        return None
+
 
-@st.cache_data(show_spinner=True)
 def fetch_live_data(tickers: List[str], interval: str = "1m") -> Dict[str, pd.DataFrame]:
     """
     Fetch live stock data for multiple tickers.
+
+    Thin wrapper that canonicalizes the ticker list and delegates to the
+    cached fetch, so the cache key is order- and case-insensitive.
+
     Args:
         tickers (List[str]): List of stock ticker symbols.
         interval (str): Data interval (e.g., '1m', '5m', '15m').
@@ -15,14 +43,31 @@ def fetch_live_data(tickers: List[str], interval: str = "1m") -> Dict[str, pd.Da
     Returns:
         Dict[str, pd.DataFrame]: Dictionary mapping ticker to its DataFrame (only valid tickers).
     """
-    data = {}
-    for ticker in tickers:
-        try:
-            t = ticker.upper().strip()
-            stock = yf.Ticker(t)
-            hist = stock.history(period="1d", interval=interval)
-            if not hist.empty:
-                data[t] = hist
-        except Exception:
-            continue
-    return data
+    canonical = normalize_tickers(tickers)
+    if not canonical:
+        return {}
+    return _fetch_live_cached(canonical, interval)
+
+
+# Live data is refetched at most once a minute; between expiries the 10 s
+# autorefresh is served from cache without re-pickling fresh downloads.
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _fetch_live_cached(canonical: Tuple[str, ...], interval: str) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch live data for a canonical (sorted, deduplicated, uppercase) ticker
+    tuple. All tickers go out in a single batched yf.download call; if the
+    batch call fails, falls back to per-ticker fetches through the shared
+    thread pool.
+    """
+    upper_tickers = list(canonical)
+    try:
+        df = yf.download(
+            upper_tickers, period="1d", interval=interval,
+            group_by='ticker', threads=True, progress=False, auto_adjust=False,
+            session=_http_session()
+        )
+        return split_batch_download(df, upper_tickers)
+    except Exception:
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(upper_tickers))) as executor:
+            results = executor.map(lambda t: (t, _fetch_intraday(t, interval)), upper_tickers)
+        return {t: hist for t, hist in results if hist is not None}
@@ -0,0 +1,108 @@
+"""
+ticker_registry.py
+Process-level registry of yfinance Ticker objects.
+
+Constructing yf.Ticker re-initializes session state, cookies, and the crumb
+handshake; with the dashboard autorefreshing every 10 s that cost is paid per
+ticker per refresh. Reusing one Ticker per symbol keeps its underlying HTTP
+session (and keep-alive connections) warm across reruns.
+"""
+
+from typing import Dict
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter, Retry
+
+# Prefer yfinance-cache when available: it persists OHLC bars on disk and only
+# fetches the increment since the last known-final bar, so steady-state
+# autorefreshes do near-zero network IO. Its Ticker is a drop-in replacement
+# for .history() only — it has no `splits` attribute and its
+# get_earnings_dates takes a different signature — so event endpoints always
+# go through plain yfinance (see get_event_ticker).
+try:
+    import yfinance_cache as yf
+except ImportError:
+    import yfinance as yf
+
+import yfinance as _yf_events
+
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """One pooled HTTP session shared by every Ticker.
+
+    Without this each Ticker opens its own requests.Session, so TCP+TLS
+    handshakes are repeated per symbol; a shared session keeps one pooled
+    keep-alive connection to Yahoo across all symbols and reruns, and the
+    mounted adapter retries transient failures with backoff.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@st.cache_resource(show_spinner=False)
+def _ticker_registry() -> Dict[str, "yf.Ticker"]:
+    """Process-local Ticker registry with a Streamlit-managed lifecycle.
+
+    Ticker objects hold live HTTP sessions and are not serializable, so this
+    is a cache_resource (shared object) rather than cache_data (pickled copy).
+    """
+    return {}
+
+
+def get_ticker(symbol: str) -> "yf.Ticker":
+    """
+    Return a memoized Ticker (yfinance-cache if installed, else yfinance)
+    for the given symbol.
+
+    Args:
+        symbol (str): Stock ticker symbol (any case, surrounding whitespace ok).
+
+    Returns:
+        yf.Ticker: Shared Ticker instance for the normalized symbol.
+        Falls back to plain yfinance when yfinance-cache is not installed.
+    """
+    registry = _ticker_registry()
+    sym = symbol.upper().strip()
+    ticker = registry.get(sym)
+    if ticker is None:
+        ticker = registry[sym] = yf.Ticker(sym, session=_http_session())
+    return ticker
+
+
+@st.cache_resource(show_spinner=False)
+def _event_ticker_registry() -> Dict[str, "_yf_events.Ticker"]:
+    """Plain-yfinance Tickers for the event endpoints; see get_event_ticker."""
+    return {}
+
+
+def get_event_ticker(symbol: str) -> "_yf_events.Ticker":
+    """
+    Return a memoized plain-yfinance Ticker for event endpoints
+    (splits, get_earnings_dates).
+
+    yfinance-cache only mirrors the history endpoints: its Ticker has no
+    `splits` and its get_earnings_dates drops the `limit=` kwarg, so routing
+    event fetches through it fails (and the failures look like any other
+    payload error, so the markers just vanish). When yfinance-cache is not
+    installed this is the same object get_ticker returns.
+
+    Args:
+        symbol (str): Stock ticker symbol (any case, surrounding whitespace ok).
+
+    Returns:
+        _yf_events.Ticker: Shared plain-yfinance Ticker for the normalized
+        symbol.
+    """
+    if yf is _yf_events:
+        return get_ticker(symbol)
+    registry = _event_ticker_registry()
+    sym = symbol.upper().strip()
+    ticker = registry.get(sym)
+    if ticker is None:
+        ticker = registry[sym] = _yf_events.Ticker(sym, session=_http_session())
+    return ticker
@@ -3,6 +3,7 @@ i18n.py
 Internationalization support for Equity Navigator.
 """
 
+import sys
 from typing import Dict
 
 # Supported languages
@@ -26,6 +27,8 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "current_close": "Current Close",
         "pct_change": "% Change",
         "high_low": "High / Low",
+        "high": "High",
+        "low": "Low",
         "download_data": "Download Data",
         "download_key_metrics": "Download Key Metrics as CSV",
         "download_history": "Download {ticker} Historical Data as CSV",
@@ -55,6 +58,8 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "current_close": "最新收盤價",
         "pct_change": "漲跌幅",
         "high_low": "最高 / 最低",
+        "high": "最高",
+        "low": "最低",
         "download_data": "下載資料",
         "download_key_metrics": "下載主要指標 CSV",
         "download_history": "下載 {ticker} 歷史資料 CSV",
@@ -84,6 +89,8 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "current_close": "Cierre actual",
         "pct_change": "% Cambio",
         "high_low": "Alto / Bajo",
+        "high": "Alto",
+        "low": "Bajo",
         "download_data": "Descargar datos",
         "download_key_metrics": "Descargar métricas clave CSV",
         "download_history": "Descargar historial de {ticker} CSV",
@@ -103,11 +110,22 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
     }
 }
 
+# Interned per-language tables, frozen at import. Interning makes the
+# returned labels share storage with literals elsewhere in the app and keeps
+# repeated widget-key comparisons pointer-fast; every t() call is then a
+# plain dict hit with no caching layer in between.
+_T: Dict[str, Dict[str, str]] = {
+    lang: {key: sys.intern(val) for key, val in table.items()}
+    for lang, table in TRANSLATIONS.items()
+}
+
+
 def t(key: str, lang: str = "en", **kwargs) -> str:
     """
-    Translate a key to the selected language.
+    Translate a key to the selected language, falling back to English and
+    then the key itself. Short-circuits when there is nothing to format.
     """
-    text = TRANSLATIONS.get(lang, TRANSLATIONS["en"]).get(key, key)
+    text = _T.get(lang, _T["en"]).get(key, key)
     if kwargs:
         return text.format(**kwargs)
     return text
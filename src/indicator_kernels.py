@@ -0,0 +1,480 @@
+"""
+indicator_kernels.py
+Numba-compiled numeric kernels backing the technical indicators.
+
+Each kernel is a single O(N) pass over plain NumPy arrays, bypassing pandas'
+generic rolling dispatch and its per-window intermediate allocations. Numba is
+optional: when it is not installed the kernels run as ordinary Python
+functions with identical results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Fallback decorator so kernels run as plain Python without numba."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit("float64[:](float64[:], int64)", cache=True, fastmath=True)
+def _sma_loop(close: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average via a running sum, O(1) per step."""
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    s = 0.0
+    for i in range(n):
+        s += close[i]
+        if i >= window:
+            s -= close[i - window]
+        if i >= window - 1:
+            out[i] = s / window
+    return out
+
+
+@njit("float64[:](float64[:], float64)", cache=True, fastmath=True)
+def _ema_loop(close: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponential moving average recursion, seeded from the first value
+    to match pandas ewm(adjust=False)."""
+    n = close.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    e = close[0]
+    out[0] = e
+    for i in range(1, n):
+        e += alpha * (close[i] - e)
+        out[i] = e
+    return out
+
+
+@njit("UniTuple(float64[:], 2)(float64[:], int64)", cache=True, fastmath=True)
+def _bollinger_loop(close: np.ndarray, window: int):
+    """
+    Bollinger Bands in one pass: a running sum and sum-of-squares give the
+    rolling mean and sample std in O(1) per step, instead of separate
+    rolling.mean() and rolling.std() passes that are O(window) per step.
+    """
+    n = close.shape[0]
+    upper = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        x = close[i]
+        s += x
+        s2 += x * x
+        if i >= window:
+            old = close[i - window]
+            s -= old
+            s2 -= old * old
+        if i >= window - 1:
+            mean = s / window
+            # Sample variance (ddof=1), matching pandas rolling.std()
+            var = (s2 - s * s / window) / (window - 1)
+            if var < 0.0:
+                var = 0.0
+            std = np.sqrt(var)
+            upper[i] = mean + 2.0 * std
+            lower[i] = mean - 2.0 * std
+    return upper, lower
+
+
+@njit("UniTuple(float64[:], 2)(float64[:], float64, float64, float64)", cache=True, fastmath=True)
+def _macd_loop(close: np.ndarray, a12: float, a26: float, a9: float):
+    """
+    MACD and signal line in one fused pass: the three EMAs (span 12, 26, 9)
+    are carried as scalars and updated at the same index, instead of three
+    separate full-array ewm passes with intermediate allocations.
+    """
+    n = close.shape[0]
+    macd_out = np.empty(n)
+    sig_out = np.empty(n)
+    if n == 0:
+        return macd_out, sig_out
+    e12 = close[0]
+    e26 = close[0]
+    sig = 0.0
+    for i in range(n):
+        e12 += a12 * (close[i] - e12)
+        e26 += a26 * (close[i] - e26)
+        m = e12 - e26
+        sig += a9 * (m - sig)
+        macd_out[i] = m
+        sig_out[i] = sig
+    return macd_out, sig_out
+
+
+@njit("float64[:](float64[:], int64)", cache=True, fastmath=True)
+def _rsi_loop(close: np.ndarray, window: int) -> np.ndarray:
+    """
+    Wilder RSI in one pass: seed the average gain/loss over the first window,
+    then carry both forward recursively instead of re-scanning a rolling
+    window of masked deltas.
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    if n <= window:
+        return rsi
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, window + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0.0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= window
+    avg_loss /= window
+    denom = avg_gain + avg_loss
+    if denom > 0.0:
+        rsi[window] = 100.0 * avg_gain / denom
+    for i in range(window + 1, n):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        avg_gain = (avg_gain * (window - 1) + gain) / window
+        avg_loss = (avg_loss * (window - 1) + loss) / window
+        denom = avg_gain + avg_loss
+        if denom > 0.0:
+            rsi[i] = 100.0 * avg_gain / denom
+    return rsi
+
+
+@njit("float64[:](float64[:], int64)", cache=True)
+def _rolling_max_loop(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling maximum via a monotonic deque: each element is pushed and popped
+    at most once, so the whole pass is O(N) regardless of window size
+    (pandas' generic path degrades toward O(N*window)).
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    idx = np.empty(n, np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and x[idx[tail - 1]] <= x[i]:
+            tail -= 1
+        idx[tail] = i
+        tail += 1
+        if idx[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = x[idx[head]]
+    return out
+
+
+@njit("float64[:](float64[:], int64)", cache=True)
+def _rolling_min_loop(x: np.ndarray, window: int) -> np.ndarray:
+    """Rolling minimum, mirror of _rolling_max_loop."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    idx = np.empty(n, np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and x[idx[tail - 1]] >= x[i]:
+            tail -= 1
+        idx[tail] = i
+        tail += 1
+        if idx[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = x[idx[head]]
+    return out
+
+
+@njit("UniTuple(float64[:], 4)(float64[:], float64[:], float64[:], float64[:], int64, int64, int64)",
+      cache=True, fastmath=True)
+def _stoch_atr_vwap_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray,
+                         k_window: int, d_window: int, atr_window: int):
+    """
+    Stochastic %K/%D, ATR, and VWAP fused into one pass over OHLCV, so the
+    four input arrays are read once instead of once per indicator.
+    """
+    n = close.shape[0]
+    k = np.full(n, np.nan)
+    d = np.full(n, np.nan)
+    atr = np.full(n, np.nan)
+    vwap = np.empty(n)
+    tr = np.empty(n)
+    pv_sum = 0.0
+    v_sum = 0.0
+    tr_sum = 0.0
+    # Monotonic deques for the %K rolling high/low: O(1) amortized per step
+    # instead of rescanning the whole k_window each bar.
+    idx_hi = np.empty(n, np.int64)
+    idx_lo = np.empty(n, np.int64)
+    hi_head = 0
+    hi_tail = 0
+    lo_head = 0
+    lo_tail = 0
+    for i in range(n):
+        # VWAP: cumulative price*volume over cumulative volume
+        pv_sum += close[i] * volume[i]
+        v_sum += volume[i]
+        vwap[i] = pv_sum / v_sum if v_sum > 0.0 else np.nan
+        # True range (first bar has no previous close, so it's high-low,
+        # matching the NaN-skipping concat().max() it replaces)
+        if i == 0:
+            tr[i] = high[i] - low[i]
+        else:
+            hl = high[i] - low[i]
+            hc = abs(high[i] - close[i - 1])
+            lc = abs(low[i] - close[i - 1])
+            tr[i] = max(hl, max(hc, lc))
+        tr_sum += tr[i]
+        if i >= atr_window:
+            tr_sum -= tr[i - atr_window]
+        if i >= atr_window - 1:
+            atr[i] = tr_sum / atr_window
+        # Stochastic %K over the k_window high/low range
+        while hi_tail > hi_head and high[idx_hi[hi_tail - 1]] <= high[i]:
+            hi_tail -= 1
+        idx_hi[hi_tail] = i
+        hi_tail += 1
+        if idx_hi[hi_head] <= i - k_window:
+            hi_head += 1
+        while lo_tail > lo_head and low[idx_lo[lo_tail - 1]] >= low[i]:
+            lo_tail -= 1
+        idx_lo[lo_tail] = i
+        lo_tail += 1
+        if idx_lo[lo_head] <= i - k_window:
+            lo_head += 1
+        if i >= k_window - 1:
+            lo = low[idx_lo[lo_head]]
+            rng = high[idx_hi[hi_head]] - lo
+            if rng > 0.0:
+                k[i] = 100.0 * (close[i] - lo) / rng
+        # %D: SMA of %K
+        if i >= k_window + d_window - 2:
+            s = 0.0
+            valid = True
+            for j in range(i - d_window + 1, i + 1):
+                if np.isnan(k[j]):
+                    valid = False
+                    break
+                s += k[j]
+            if valid:
+                d[i] = s / d_window
+    return k, d, atr, vwap
+
+
+@njit("float64[:, :](float64[:, :], int64[:], int64)", cache=True, parallel=True)
+def _rsi_batch(close2d: np.ndarray, lengths: np.ndarray, window: int) -> np.ndarray:
+    """
+    RSI for a batch of tickers: one padded row per ticker (lengths gives the
+    valid prefix of each row), computed across rows in parallel with prange.
+    Rows are independent, so this scales with core count.
+    """
+    rows = close2d.shape[0]
+    out = np.full(close2d.shape, np.nan)
+    for t in prange(rows):
+        out[t, :lengths[t]] = _rsi_loop(close2d[t, :lengths[t]], window)
+    return out
+
+
+@njit("UniTuple(float64[:, :], 2)(float64[:, :], int64[:], float64, float64, float64)",
+      cache=True, parallel=True)
+def _macd_batch(close2d: np.ndarray, lengths: np.ndarray, a12: float, a26: float, a9: float):
+    """MACD/signal for a batch of tickers, parallel across rows."""
+    rows = close2d.shape[0]
+    macd_out = np.full(close2d.shape, np.nan)
+    sig_out = np.full(close2d.shape, np.nan)
+    for t in prange(rows):
+        m, s = _macd_loop(close2d[t, :lengths[t]], a12, a26, a9)
+        macd_out[t, :lengths[t]] = m
+        sig_out[t, :lengths[t]] = s
+    return macd_out, sig_out
+
+
+@njit("UniTuple(float64[:], 5)(float64[:], float64[:], float64[:])", cache=True)
+def _ichimoku_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray):
+    """
+    All five Ichimoku lines in one fused pass: six monotonic deques (9/26/52
+    highs and lows) advance together over a single traversal of High/Low,
+    and the 26-bar projections are written forward in place, so no
+    intermediate extrema arrays or shift passes are materialized.
+    """
+    n = close.shape[0]
+    tenkan = np.full(n, np.nan)
+    kijun = np.full(n, np.nan)
+    span_a = np.full(n, np.nan)
+    span_b = np.full(n, np.nan)
+    chikou = np.full(n, np.nan)
+    hi9 = np.empty(n, np.int64)
+    lo9 = np.empty(n, np.int64)
+    hi26 = np.empty(n, np.int64)
+    lo26 = np.empty(n, np.int64)
+    hi52 = np.empty(n, np.int64)
+    lo52 = np.empty(n, np.int64)
+    h9h = h9t = l9h = l9t = 0
+    h26h = h26t = l26h = l26t = 0
+    h52h = h52t = l52h = l52t = 0
+    for i in range(n):
+        # Advance the three high-max deques
+        while h9t > h9h and high[hi9[h9t - 1]] <= high[i]:
+            h9t -= 1
+        hi9[h9t] = i
+        h9t += 1
+        if hi9[h9h] <= i - 9:
+            h9h += 1
+        while h26t > h26h and high[hi26[h26t - 1]] <= high[i]:
+            h26t -= 1
+        hi26[h26t] = i
+        h26t += 1
+        if hi26[h26h] <= i - 26:
+            h26h += 1
+        while h52t > h52h and high[hi52[h52t - 1]] <= high[i]:
+            h52t -= 1
+        hi52[h52t] = i
+        h52t += 1
+        if hi52[h52h] <= i - 52:
+            h52h += 1
+        # Advance the three low-min deques
+        while l9t > l9h and low[lo9[l9t - 1]] >= low[i]:
+            l9t -= 1
+        lo9[l9t] = i
+        l9t += 1
+        if lo9[l9h] <= i - 9:
+            l9h += 1
+        while l26t > l26h and low[lo26[l26t - 1]] >= low[i]:
+            l26t -= 1
+        lo26[l26t] = i
+        l26t += 1
+        if lo26[l26h] <= i - 26:
+            l26h += 1
+        while l52t > l52h and low[lo52[l52t - 1]] >= low[i]:
+            l52t -= 1
+        lo52[l52t] = i
+        l52t += 1
+        if lo52[l52h] <= i - 52:
+            l52h += 1
+        # Emit the lines; the spans project 26 bars forward (shift(26))
+        if i >= 8:
+            tenkan[i] = (high[hi9[h9h]] + low[lo9[l9h]]) / 2.0
+        if i >= 25:
+            kijun[i] = (high[hi26[h26h]] + low[lo26[l26h]]) / 2.0
+            if i + 26 < n:
+                span_a[i + 26] = (tenkan[i] + kijun[i]) / 2.0
+        if i >= 51 and i + 26 < n:
+            span_b[i + 26] = (high[hi52[h52h]] + low[lo52[l52h]]) / 2.0
+        # Chikou is close shifted back 26 bars (shift(-26))
+        if i + 26 < n:
+            chikou[i] = close[i + 26]
+    return tenkan, kijun, span_a, span_b, chikou
+
+
+@njit("boolean[:](int64[:], int64, int64)", cache=True)
+def _filter_range(ns: np.ndarray, start_ns: int, end_ns: int) -> np.ndarray:
+    """Inclusive int64 range mask (nanosecond timestamps), compiled so the
+    hot batch-event path skips numpy's two-temporary boolean expression."""
+    n = ns.shape[0]
+    out = np.empty(n, np.bool_)
+    for i in range(n):
+        out[i] = start_ns <= ns[i] <= end_ns
+    return out
+
+
+@njit("UniTuple(float64, 4)(float64[:])", cache=True)
+def _close_stats(a: np.ndarray):
+    """
+    First, last, high, and low of a series in a single sweep, replacing the
+    separate max() and min() reductions (plus two scalar lookups) with one
+    branch-predictable pass over the array.
+    """
+    lo = a[0]
+    hi = a[0]
+    for i in range(1, a.shape[0]):
+        v = a[i]
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return a[0], a[a.shape[0] - 1], hi, lo
+
+
+@njit("int64[:](float64[:], float64[:], int64)", cache=True)
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling: pick the point in each
+    bucket that forms the largest triangle with the previously kept point
+    and the next bucket's centroid. Returns the kept indices so callers can
+    slice x and y (and datetime axes) consistently.
+    """
+    n = y.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    out = np.empty(n_out, np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Centroid of the next bucket
+        nxt0 = int((i + 1) * every) + 1
+        nxt1 = int((i + 2) * every) + 1
+        if nxt1 > n:
+            nxt1 = n
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(nxt0, nxt1):
+            avg_x += x[j]
+            avg_y += y[j]
+        m = nxt1 - nxt0
+        if m > 0:
+            avg_x /= m
+            avg_y /= m
+        # Largest triangle within the current bucket
+        cur0 = int(i * every) + 1
+        cur1 = nxt0
+        max_area = -1.0
+        max_idx = cur0
+        for j in range(cur0, cur1):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > max_area:
+                max_area = area
+                max_idx = j
+        out[i + 1] = max_idx
+        a = max_idx
+    return out
+
+
+def _warmup() -> None:
+    """
+    Run every kernel once on tiny arrays at import time. With explicit
+    signatures and cache=True the machine code is compiled (or loaded from
+    the on-disk cache) here, so the first form submission never pays the
+    JIT stall.
+    """
+    z = np.zeros(4, np.float64)
+    _sma_loop(z, 2)
+    _ema_loop(z, 0.5)
+    _bollinger_loop(z, 2)
+    _macd_loop(z, 0.5, 0.5, 0.5)
+    _rsi_loop(z, 2)
+    _stoch_atr_vwap_loop(z, z, z, z, 2, 2, 2)
+    _rolling_max_loop(z, 2)
+    _rolling_min_loop(z, 2)
+    _ichimoku_loop(z, z, z)
+    _lttb_indices(np.arange(4.0), z, 3)
+    _close_stats(z)
+    _filter_range(np.zeros(4, np.int64), 0, 1)
+    z2 = np.zeros((1, 4), np.float64)
+    n1 = np.full(1, 4, np.int64)
+    _rsi_batch(z2, n1, 2)
+    _macd_batch(z2, n1, 0.5, 0.5, 0.5)
+
+
+_warmup()
@@ -3,110 +3,228 @@ Additional technical indicators and overlays for Equity Navigator
 Implements: Stochastic Oscillator, ATR, VWAP, Ichimoku Cloud, and user-defined indicator support
 """
 
+import ast
+from types import CodeType
+
+import numpy as np
 import pandas as pd
 from typing import Optional, Tuple, Dict
 
+from src.indicator_kernels import (
+    NUMBA_AVAILABLE, _bollinger_loop, _ema_loop, _ichimoku_loop, _macd_batch,
+    _macd_loop, _rsi_batch, _rsi_loop, _sma_loop, _stoch_atr_vwap_loop
+)
+
 
 # --- Indicator Functions ---
 def add_sma(df: pd.DataFrame, window: int = 20) -> pd.Series:
-    """Simple Moving Average"""
-    return df['Close'].rolling(window=window).mean()
+    """Simple Moving Average (compiled running-sum loop)"""
+    close = df['Close'].to_numpy(np.float64)
+    return pd.Series(_sma_loop(close, window), index=df.index)
 
 
 def add_ema(df: pd.DataFrame, window: int = 20) -> pd.Series:
-    """Exponential Moving Average"""
-    return df['Close'].ewm(span=window, adjust=False).mean()
+    """Exponential Moving Average (compiled recursion)"""
+    close = df['Close'].to_numpy(np.float64)
+    return pd.Series(_ema_loop(close, 2 / (window + 1)), index=df.index)
 
 
 def add_rsi(df: pd.DataFrame, window: int = 14) -> pd.Series:
-    """Relative Strength Index"""
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    """Relative Strength Index (Wilder smoothing, single compiled pass)"""
+    if not NUMBA_AVAILABLE:
+        # Without numba, Wilder's recursion as a vectorized ewm stays in
+        # compiled pandas code instead of an interpreted Python loop.
+        delta = df['Close'].diff()
+        gain = delta.clip(lower=0)
+        loss = (-delta).clip(lower=0)
+        avg_gain = gain.ewm(alpha=1 / window, adjust=False, min_periods=window).mean()
+        avg_loss = loss.ewm(alpha=1 / window, adjust=False, min_periods=window).mean()
+        rs = avg_gain / avg_loss
+        return 100 - 100 / (1 + rs)
+    close = df['Close'].to_numpy(np.float64)
+    return pd.Series(_rsi_loop(close, window), index=df.index)
+
+
+def _stack_closes(data: Dict[str, pd.DataFrame]) -> Tuple[list, np.ndarray, np.ndarray]:
+    """Pack per-ticker Close columns into one padded 2D array for the batch
+    kernels, with a lengths vector marking each row's valid prefix (tickers
+    can cover different numbers of bars)."""
+    tickers = list(data)
+    lengths = np.fromiter((len(data[tk]) for tk in tickers), np.int64, count=len(tickers))
+    close2d = np.zeros((len(tickers), int(lengths.max()) if len(tickers) else 0))
+    for i, tk in enumerate(tickers):
+        close2d[i, :lengths[i]] = data[tk]['Close'].to_numpy(np.float64)
+    return tickers, close2d, lengths
+
+
+def add_rsi_many(data: Dict[str, pd.DataFrame], window: int = 14) -> Dict[str, pd.Series]:
+    """RSI for several tickers at once, parallel across tickers when numba
+    is available; falls back to per-ticker add_rsi otherwise."""
+    if not NUMBA_AVAILABLE or len(data) <= 1:
+        return {tk: add_rsi(h, window) for tk, h in data.items()}
+    tickers, close2d, lengths = _stack_closes(data)
+    out = _rsi_batch(close2d, lengths, window)
+    return {tk: pd.Series(out[i, :lengths[i]], index=data[tk].index)
+            for i, tk in enumerate(tickers)}
+
+
+def add_macd_many(data: Dict[str, pd.DataFrame]) -> Dict[str, Tuple[pd.Series, pd.Series]]:
+    """MACD/signal for several tickers at once, parallel across tickers when
+    numba is available; falls back to per-ticker add_macd otherwise."""
+    if not NUMBA_AVAILABLE or len(data) <= 1:
+        return {tk: add_macd(h) for tk, h in data.items()}
+    tickers, close2d, lengths = _stack_closes(data)
+    macd2d, sig2d = _macd_batch(close2d, lengths, 2 / 13, 2 / 27, 2 / 10)
+    return {tk: (pd.Series(macd2d[i, :lengths[i]], index=data[tk].index),
+                 pd.Series(sig2d[i, :lengths[i]], index=data[tk].index))
+            for i, tk in enumerate(tickers)}
 
 
 def add_macd(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
-    """MACD and Signal Line"""
-    ema12 = df['Close'].ewm(span=12, adjust=False).mean()
-    ema26 = df['Close'].ewm(span=26, adjust=False).mean()
-    macd = ema12 - ema26
-    signal = macd.ewm(span=9, adjust=False).mean()
-    return macd, signal
+    """MACD and Signal Line (single fused compiled pass)"""
+    close = df['Close'].to_numpy(np.float64)
+    macd, signal = _macd_loop(close, 2 / 13, 2 / 27, 2 / 10)
+    return pd.Series(macd, index=df.index), pd.Series(signal, index=df.index)
 
 
 def add_bollinger(df: pd.DataFrame, window: int = 20) -> Tuple[pd.Series, pd.Series]:
-    """Bollinger Bands"""
-    sma = add_sma(df, window)
-    std = df['Close'].rolling(window=window).std()
-    upper = sma + 2 * std
-    lower = sma - 2 * std
-    return upper, lower
+    """Bollinger Bands (single compiled running-sum pass)"""
+    close = df['Close'].to_numpy(np.float64)
+    upper, lower = _bollinger_loop(close, window)
+    return pd.Series(upper, index=df.index), pd.Series(lower, index=df.index)
+
+
+def fused_ohlcv_indicators(df: pd.DataFrame, k_window: int = 14, d_window: int = 3,
+                           atr_window: int = 14) -> Dict[str, pd.Series]:
+    """
+    Compute Stochastic %K/%D, ATR, and VWAP in a single compiled pass over
+    OHLCV, so the input columns are scanned once instead of once per
+    indicator.
+
+    Returns:
+        Dict[str, pd.Series]: 'stoch_k', 'stoch_d', 'atr', 'vwap'.
+    """
+    high = df['High'].to_numpy(np.float64)
+    low = df['Low'].to_numpy(np.float64)
+    close = df['Close'].to_numpy(np.float64)
+    volume = df['Volume'].to_numpy(np.float64)
+    k, d, atr, vwap = _stoch_atr_vwap_loop(high, low, close, volume, k_window, d_window, atr_window)
+    index = df.index
+    return {
+        'stoch_k': pd.Series(k, index=index),
+        'stoch_d': pd.Series(d, index=index),
+        'atr': pd.Series(atr, index=index),
+        'vwap': pd.Series(vwap, index=index),
+    }
 
 
 def add_stochastic(df: pd.DataFrame, k_window: int = 14, d_window: int = 3) -> Tuple[pd.Series, pd.Series]:
     """Stochastic Oscillator (K%D)"""
-    low_min = df['Low'].rolling(window=k_window).min()
-    high_max = df['High'].rolling(window=k_window).max()
-    k = 100 * ((df['Close'] - low_min) / (high_max - low_min))
-    d = k.rolling(window=d_window).mean()
-    return k, d
+    fused = fused_ohlcv_indicators(df, k_window=k_window, d_window=d_window)
+    return fused['stoch_k'], fused['stoch_d']
 
 
 def add_atr(df: pd.DataFrame, window: int = 14) -> pd.Series:
     """Average True Range (ATR)"""
-    high_low = df['High'] - df['Low']
-    high_close = (df['High'] - df['Close'].shift()).abs()
-    low_close = (df['Low'] - df['Close'].shift()).abs()
-    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    atr = tr.rolling(window=window).mean()
-    return atr
+    if not NUMBA_AVAILABLE:
+        # Without numba, reduce the three true-range candidates on ndarrays
+        # in one ufunc call instead of a concat + axis-1 reduction.
+        high = df['High'].to_numpy(np.float64)
+        low = df['Low'].to_numpy(np.float64)
+        close_prev = np.roll(df['Close'].to_numpy(np.float64), 1)
+        tr = np.maximum.reduce([high - low, np.abs(high - close_prev), np.abs(low - close_prev)])
+        if tr.size:
+            tr[0] = high[0] - low[0]  # first bar has no previous close
+        return pd.Series(tr, index=df.index).rolling(window).mean()
+    return fused_ohlcv_indicators(df, atr_window=window)['atr']
 
 
 def add_vwap(df: pd.DataFrame) -> pd.Series:
     """Volume Weighted Average Price (VWAP)"""
-    vwap = (df['Close'] * df['Volume']).cumsum() / df['Volume'].cumsum()
-    return vwap
+    if not NUMBA_AVAILABLE:
+        # Without numba, cumulate on ndarrays: no elementwise-product Series,
+        # no two intermediate cumsum Series, no index-alignment pass.
+        close = df['Close'].to_numpy(np.float64)
+        volume = df['Volume'].to_numpy(np.float64)
+        return pd.Series(np.cumsum(close * volume) / np.cumsum(volume), index=df.index)
+    return fused_ohlcv_indicators(df)['vwap']
 
 
 def add_ichimoku(df: pd.DataFrame) -> Dict[str, pd.Series]:
-    """Ichimoku Cloud"""
-    high9 = df['High'].rolling(window=9).max()
-    low9 = df['Low'].rolling(window=9).min()
-    tenkan_sen = (high9 + low9) / 2
-    high26 = df['High'].rolling(window=26).max()
-    low26 = df['Low'].rolling(window=26).min()
-    kijun_sen = (high26 + low26) / 2
-    senkou_span_a = ((tenkan_sen + kijun_sen) / 2).shift(26)
-    high52 = df['High'].rolling(window=52).max()
-    low52 = df['Low'].rolling(window=52).min()
-    senkou_span_b = ((high52 + low52) / 2).shift(26)
-    chikou_span = df['Close'].shift(-26)
+    """Ichimoku Cloud (all five lines from one fused compiled pass)"""
+    high = df['High'].to_numpy(np.float64)
+    low = df['Low'].to_numpy(np.float64)
+    close = df['Close'].to_numpy(np.float64)
+    tenkan, kijun, span_a, span_b, chikou = _ichimoku_loop(high, low, close)
+    index = df.index
     return {
-        'tenkan_sen': tenkan_sen,
-        'kijun_sen': kijun_sen,
-        'senkou_span_a': senkou_span_a,
-        'senkou_span_b': senkou_span_b,
-        'chikou_span': chikou_span
+        'tenkan_sen': pd.Series(tenkan, index=index),
+        'kijun_sen': pd.Series(kijun, index=index),
+        'senkou_span_a': pd.Series(span_a, index=index),
+        'senkou_span_b': pd.Series(span_b, index=index),
+        'chikou_span': pd.Series(chikou, index=index)
     }
 
 
+# --- User-defined overlays ---
+_ALLOWED_COLUMNS = {'Close', 'Open', 'High', 'Low', 'Volume'}
+_ALLOWED_METHODS = {
+    'rolling', 'ewm', 'mean', 'std', 'shift', 'diff', 'cumsum', 'pct_change',
+    'min', 'max', 'sum', 'abs', 'clip'
+}
+_ALLOWED_NODES = (
+    ast.Expression, ast.Name, ast.Attribute, ast.Call, ast.BinOp, ast.UnaryOp,
+    ast.Constant, ast.Load, ast.keyword,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.USub, ast.UAdd
+)
+
+# Formula -> compiled code object (or None for rejected/invalid formulas).
+# Caching failures too means a bad formula is parsed once, not every rerun.
+_COMPILED: Dict[str, Optional[CodeType]] = {}
+
+
+def _compile_formula(formula: str) -> Optional[CodeType]:
+    """
+    Parse a user formula, verify every AST node against a whitelist, and
+    compile it. Attribute access is restricted to known pandas methods (no
+    dunders), and names are restricted to OHLCV columns, which closes the
+    dunder-escape holes of raw eval() on a string.
+    """
+    try:
+        tree = ast.parse(formula, mode='eval')
+    except (SyntaxError, ValueError):
+        return None
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            return None
+        if isinstance(node, ast.Attribute) and node.attr not in _ALLOWED_METHODS:
+            return None
+        if isinstance(node, ast.Name) and node.id not in _ALLOWED_COLUMNS:
+            return None
+    return compile(tree, '<user-indicator>', 'eval')
+
+
 def add_user_indicator(df: pd.DataFrame, formula: str) -> Optional[pd.Series]:
     """
     Evaluate a user-defined indicator formula safely.
+
+    The formula is AST-checked and compiled once per distinct string, so
+    repeated chart renders skip the parser entirely.
+
     Args:
         df (pd.DataFrame): Stock data.
         formula (str): Formula using pandas syntax, e.g. 'Close.rolling(10).mean()'.
     Returns:
         Optional[pd.Series]: Resulting indicator series, or None if invalid.
     """
-    allowed_names = {'Close', 'Open', 'High', 'Low', 'Volume'}
+    if formula not in _COMPILED:
+        _COMPILED[formula] = _compile_formula(formula)
+    code = _COMPILED[formula]
+    if code is None:
+        return None
     try:
-        # Only allow access to columns, no builtins or globals
-        local_dict = {col: df[col] for col in allowed_names if col in df.columns}
-        result = eval(formula, {"__builtins__": None}, local_dict)
+        local_dict = {col: df[col] for col in _ALLOWED_COLUMNS if col in df.columns}
+        result = eval(code, {"__builtins__": {}}, local_dict)
         if isinstance(result, pd.Series):
             return result
     except Exception:
@@ -1,9 +1,27 @@
 from typing import Dict, Any
 import streamlit as st
-import yfinance as yf
 import plotly.graph_objs as go
 import pandas as pd
 
+from src.data_fetching.ticker_registry import get_ticker
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _spy_returns() -> pd.Series:
+    """
+    Daily SPY returns for the beta benchmark, refetched at most hourly.
+
+    Keeps the benchmark download out of the render path: every portfolio
+    rerun previously re-downloaded a year of SPY bars.
+    """
+    sp500 = get_ticker("SPY").history(period="1y", interval="1d")
+    # Ticker.history returns an exchange-tz index; the portfolio frames are
+    # tz-naive, and concatenating the two raises. Drop the zone so the beta
+    # alignment below actually aligns.
+    if isinstance(sp500.index, pd.DatetimeIndex) and sp500.index.tz is not None:
+        sp500.index = sp500.index.tz_localize(None)
+    return sp500["Close"].pct_change().dropna()
+
 
 def create_portfolio_section(port_data: Dict[str, Any]) -> None:
     """
@@ -23,7 +41,9 @@ def create_portfolio_section(port_data: Dict[str, Any]) -> None:
         ticker = item['ticker']
         qty = item['quantity']
         if ticker in port_data:
-            price = port_data[ticker]['Close'][-1]
+            # .iat is the positional scalar fast path (the [-1] label lookup
+            # is also deprecated for non-integer indexes).
+            price = port_data[ticker]['Close'].iat[-1]
             value = price * qty
             values.append(value)
             total_value += value
@@ -46,23 +66,21 @@ def create_portfolio_section(port_data: Dict[str, Any]) -> None:
         st.write(f"**Total Portfolio Value:** ${total_value:,.2f}")
         # Risk Metrics
         st.subheader("Portfolio Risk Metrics")
-        # Volatility (std dev of returns)
-        returns = []
-        for ticker in port_df["Ticker"]:
-            hist = port_data[ticker]["Close"]
-            ret = hist.pct_change().dropna()
-            returns.append(ret)
-        if returns:
-            port_returns = pd.concat(returns, axis=1).mean(axis=1)
+        # One wide Close frame, one pct_change pass, one equal-weight mean —
+        # shared by both volatility and beta instead of per-ticker loops and
+        # two separate concats.
+        port_close = pd.concat({tk: port_data[tk]["Close"] for tk in port_df["Ticker"]}, axis=1)
+        port_returns = port_close.pct_change().dropna(how='all').mean(axis=1)
+        if not port_returns.empty:
             volatility = port_returns.std() * (252 ** 0.5)  # annualized
             st.write(f"**Portfolio Volatility (annualized):** {volatility:.2%}")
         # Beta (vs. S&P 500)
         try:
-            sp500 = yf.Ticker("SPY").history(period="1y", interval="1d")
-            sp500_ret = sp500["Close"].pct_change().dropna()
-            if returns:
-                port_ret = pd.concat(returns, axis=1).mean(axis=1)
-                beta = port_ret.cov(sp500_ret) / sp500_ret.var()
-                st.write(f"**Portfolio Beta (vs. S&P 500):** {beta:.2f}")
+            sp500_ret = _spy_returns()
+            if not port_returns.empty:
+                aligned = pd.concat([port_returns, sp500_ret], axis=1).dropna()
+                if len(aligned) > 1:
+                    beta = aligned.iloc[:, 0].cov(aligned.iloc[:, 1]) / aligned.iloc[:, 1].var()
+                    st.write(f"**Portfolio Beta (vs. S&P 500):** {beta:.2f}")
         except Exception:
             st.write("Beta calculation unavailable.")
\ No newline at end of file
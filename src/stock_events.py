@@ -3,11 +3,63 @@ stock_events.py
 Module for fetching and formatting significant stock events (earnings, splits) for annotation on charts.
 """
 
-import yfinance as yf
 import pandas as pd
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from functools import lru_cache
+from typing import List, Dict
 
-def get_stock_events(ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> List[Dict[str, Any]]:
+from src.data_fetching.ticker_registry import get_event_ticker
+from src.indicator_kernels import NUMBA_AVAILABLE, _filter_range
+
+MAX_EVENT_WORKERS = 10
+
+# Categorical event types: two interned codes instead of one object string
+# per event row.
+_EVENT_TYPE = pd.CategoricalDtype(['Earnings', 'Split'])
+
+
+def _empty_events() -> pd.DataFrame:
+    """An empty events frame with the canonical columns and dtypes."""
+    return pd.DataFrame({
+        'date': pd.Series(dtype='datetime64[ns]'),
+        'type': pd.Series(dtype=_EVENT_TYPE),
+        'desc': pd.Series(dtype=object),
+    })
+
+
+@lru_cache(maxsize=2048)
+def _get_earnings(ticker: str, asof: date) -> pd.DataFrame:
+    """Raw earnings frame, fetched once per ticker per calendar day.
+
+    Earnings dates change (new quarters get announced), so an unbounded
+    entry would hide them until a process restart. Callers pass today's
+    date as ``asof``: the day rolls the key over, which gives lru_cache a
+    de-facto TTL without pulling in a caching dependency. Stale entries
+    age out of the LRU on their own.
+
+    lru_cache does not cache raised exceptions, so a failed fetch is retried
+    on the next call instead of pinning the failure.
+    """
+    earnings = get_event_ticker(ticker).get_earnings_dates(limit=20)
+    if earnings is not None and not earnings.empty:
+        # Only three of the returned columns (surprise %, report time, ...)
+        # are ever read; keeping just those shrinks what the cache holds and
+        # what every later filter copies.
+        keep = [col for col in ('Earnings Date', 'EPS Actual', 'EPS Estimate')
+                if col in earnings.columns]
+        earnings = earnings[keep]
+    return earnings
+
+
+@lru_cache(maxsize=2048)
+def _get_splits(ticker: str) -> pd.Series:
+    """Raw splits Series, fetched once per ticker per process — splits are
+    immutable history, so there is nothing to refetch within a session."""
+    return get_event_ticker(ticker).splits
+
+
+def get_stock_events(ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
     """
     Fetch significant events (earnings, splits) for a given ticker within a date range.
 
@@ -17,36 +69,125 @@ def get_stock_events(ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> Lis
         end (pd.Timestamp): End date.
 
     Returns:
-        List[Dict[str, Any]]: List of event dicts with 'date', 'type', and 'desc'.
+        pd.DataFrame: Events with columns 'date', 'type', and 'desc' —
+        columnar layout instead of one dict per event, so N events cost a
+        few contiguous arrays rather than N hash tables.
     """
-    stock = yf.Ticker(ticker)
-    events = []
-    # Earnings
+    frames = []
+    # The earnings and splits endpoints are independent blocking HTTPS
+    # calls; overlapping them makes the wall time max(RTT) instead of the
+    # sum. requests releases the GIL during socket reads, so two workers
+    # are enough. Both go through the per-ticker fetch caches, so only the
+    # first call for a ticker touches the network — the range filter below
+    # stays outside the cache and any date window reuses the same frames.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        f_earnings = executor.submit(_get_earnings, ticker, date.today())
+        f_splits = executor.submit(_get_splits, ticker)
+    # Earnings: filter with one vectorized mask instead of an iterrows()
+    # scan — per-row Series construction is the dominant cost of iterrows,
+    # and the datetime conversion and range check both run in C this way.
     try:
-        earnings = stock.get_earnings_dates(limit=20)
-        if not earnings.empty:
-            for _, row in earnings.iterrows():
-                event_date = pd.to_datetime(row['Earnings Date'])
-                if start <= event_date <= end:
-                    events.append({
-                        'date': event_date,
-                        'type': 'Earnings',
-                        'desc': f"Earnings: {row['EPS Actual']} (Est: {row['EPS Estimate']})"
-                    })
+        earnings = f_earnings.result()
+        if earnings is not None and not earnings.empty:
+            dates = pd.to_datetime(earnings['Earnings Date'].values)
+            # yfinance localizes earnings dates to the exchange zone; one
+            # vectorized conversion makes them tz-naive so the int64 view
+            # below shares an epoch with the naive start/end bounds.
+            if dates.tz is not None:
+                dates = dates.tz_convert(None)
+            # Compare the underlying int64 nanoseconds: a plain integer
+            # range check with no Timestamp dunder dispatch, and immune to
+            # the TypeError a tz-aware/naive Timestamp comparison raises.
+            # Timestamp.value is always nanoseconds, but newer pandas can
+            # hand back a non-ns index (to_datetime produces datetime64[us]
+            # under 3.x), so pin the resolution before taking the view or
+            # the mask silently compares µs against ns and comes up empty.
+            if hasattr(dates, 'as_unit'):
+                dates = dates.as_unit('ns')
+            ns = dates.asi8
+            if NUMBA_AVAILABLE:
+                # One fused compiled pass; the index view is read-only, so
+                # hand the kernel a small writable copy.
+                mask = _filter_range(ns.astype('i8'), start.value, end.value)
+            else:
+                mask = (ns >= start.value) & (ns <= end.value)
+            if mask.any():
+                actual = pd.Series(earnings['EPS Actual'].values[mask])
+                est = pd.Series(earnings['EPS Estimate'].values[mask])
+                # Series.str concatenation formats the whole column in C
+                # instead of one f-string per event.
+                desc = 'Earnings: ' + actual.astype(str) + ' (Est: ' + est.astype(str) + ')'
+                frames.append(pd.DataFrame({
+                    'date': dates[mask], 'type': 'Earnings', 'desc': desc.values
+                }))
+    # Broad on purpose: what a failed fetch raises depends on the HTTP stack
+    # yfinance happens to use (requests.RequestException historically,
+    # curl_cffi's own exceptions since 0.2.54, yfinance's YFException family
+    # for rate limits and bad payloads) and can't be stably enumerated across
+    # versions. The contract is per-source degradation — a failed earnings
+    # fetch must not discard the splits that did arrive, and vice versa.
     except Exception:
         pass
-    # Splits
+    # Splits: the Series is indexed by date and sorted, so a label slice
+    # bisects the DatetimeIndex (searchsorted) instead of masking every row.
     try:
-        splits = stock.splits
+        splits = f_splits.result()
         if splits is not None and not splits.empty:
-            for split_date, split_ratio in splits.items():
-                split_dt = pd.to_datetime(split_date)
-                if start <= split_dt <= end:
-                    events.append({
-                        'date': split_dt,
-                        'type': 'Split',
-                        'desc': f"Split: {split_ratio}"
-                    })
-    except Exception:
+            # Same normalization for the date index: without it, slicing a
+            # tz-aware index with naive bounds raises and the whole splits
+            # block used to vanish down the except path.
+            if splits.index.tz is not None:
+                splits = splits.tz_convert(None)
+            sub = splits.loc[start:end]
+            if not sub.empty:
+                desc = 'Split: ' + sub.astype(str)
+                frames.append(pd.DataFrame({
+                    'date': sub.index, 'type': 'Split', 'desc': desc.values
+                }))
+    except Exception:  # see the earnings handler above
         pass
-    return events
+    if not frames:
+        return _empty_events()
+    events = pd.concat(frames, ignore_index=True)
+    events['type'] = events['type'].astype(_EVENT_TYPE)
+    # Chronological order as part of the contract: one C-level sort here
+    # beats every caller re-sorting (earnings arrive newest-first, splits
+    # oldest-first, so the concatenation is never ordered on its own).
+    return events.sort_values('date', kind='stable', ignore_index=True)
+
+
+def _events_or_empty(ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """get_stock_events, degraded to an empty frame on any failure.
+
+    Last line of defense behind the per-source handlers: anything that
+    escapes them (or the filtering itself blowing up) should cost that
+    ticker its markers, not the whole render.
+    """
+    try:
+        return get_stock_events(ticker, start, end)
+    except Exception:
+        return _empty_events()
+
+
+def get_stock_events_many(tickers: List[str], start: pd.Timestamp, end: pd.Timestamp) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch events for several tickers concurrently.
+
+    Fans the per-ticker fetches out across a thread pool so a multi-ticker
+    chart pays roughly one round-trip of latency instead of one per ticker;
+    tickers already in the per-call cache return instantly.
+
+    Args:
+        tickers (List[str]): Stock ticker symbols.
+        start (pd.Timestamp): Start date.
+        end (pd.Timestamp): End date.
+
+    Returns:
+        Dict[str, pd.DataFrame]: Events frame per ticker.
+    """
+    tickers = list(tickers)
+    if len(tickers) <= 1:
+        return {tk: _events_or_empty(tk, start, end) for tk in tickers}
+    with ThreadPoolExecutor(max_workers=min(MAX_EVENT_WORKERS, len(tickers))) as executor:
+        futures = {executor.submit(_events_or_empty, tk, start, end): tk for tk in tickers}
+        return {futures[future]: future.result() for future in as_completed(futures)}
@@ -1,9 +1,87 @@
 from plotly import graph_objects as go
 import streamlit as st
 from typing import Dict, List, Tuple, Any
+import numpy as np
 import pandas as pd
 
-def create_volume_chart(data: Dict[str, Any]) -> None:
+from src.indicator_kernels import NUMBA_AVAILABLE, _close_stats, _lttb_indices
+
+# Above this many points the SVG path dominates browser render time; series
+# longer than this are decimated down to DECIMATE_TO points before plotting.
+MAX_PLOT_POINTS = 5000
+DECIMATE_TO = 2000
+
+
+# Memo of computed indicator series, keyed per (ticker, frame shape). The
+# key must not involve id(): st.cache_data hands each caller a fresh
+# unpickled copy, so object identity never repeats across reruns except by
+# allocator reuse — and tickers fetched for the same range share length and
+# last timestamp, so an id() collision serves ticker A's indicators on
+# ticker B's chart. The symbol plus row count plus last timestamp pins the
+# entry to one ticker's data and is still allocation-free to build; it also
+# survives reruns legitimately, since the fetch cache returns identical
+# content for a given ticker and range until its TTL expires.
+_INDICATOR_MEMO: Dict[Any, Dict[str, Any]] = {}
+_MEMO_MAX_FRAMES = 256
+
+
+def _frame_memo(ticker: str, hist: pd.DataFrame) -> Dict[str, Any]:
+    """Return (creating if needed) the memo dict for one ticker's frame."""
+    key = (ticker, len(hist), hist.index[-1] if len(hist) else None)
+    memo = _INDICATOR_MEMO.get(key)
+    if memo is None:
+        if len(_INDICATOR_MEMO) >= _MEMO_MAX_FRAMES:
+            _INDICATOR_MEMO.pop(next(iter(_INDICATOR_MEMO)))
+        memo = _INDICATOR_MEMO[key] = {}
+    return memo
+
+
+def _memo_series(ticker: str, hist: pd.DataFrame, name: str, compute) -> Any:
+    """
+    Return the named indicator for one ticker's frame, computing it at most
+    once per frame. compute is a zero-argument callable evaluated on miss.
+    """
+    memo = _frame_memo(ticker, hist)
+    if name not in memo:
+        memo[name] = compute()
+    return memo[name]
+
+
+def _memo_many(data: Dict[str, Any], name: str, compute_many) -> Dict[str, Any]:
+    """
+    Batch variant of _memo_series: only the tickers with no memoized value
+    are handed to compute_many (a dict -> dict function), so the batch
+    kernels run once over exactly the frames that need computing.
+    """
+    out = {}
+    pending = {}
+    for ticker, hist in data.items():
+        memo = _frame_memo(ticker, hist)
+        if name in memo:
+            out[ticker] = memo[name]
+        else:
+            pending[ticker] = hist
+    if pending:
+        for ticker, value in compute_many(pending).items():
+            _frame_memo(ticker, pending[ticker])[name] = value
+            out[ticker] = value
+    return out
+
+
+def _decimate(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a long line series with LTTB, keeping visually significant
+    points. Short series pass through untouched; the returned x keeps its
+    original (datetime) dtype since only indices are selected.
+    """
+    if y.shape[0] <= MAX_PLOT_POINTS:
+        return x, y
+    xf = x.astype(np.int64).astype(np.float64)
+    keep = _lttb_indices(xf, y.astype(np.float64, copy=False), DECIMATE_TO)
+    return x[keep], y[keep]
+
+
+def create_volume_chart(data: Dict[str, Any]) -> go.Figure:
     """
     Create a volume chart using the provided data.
 
@@ -11,56 +89,124 @@ def create_volume_chart(data: Dict[str, Any]) -> None:
     data (dict): A dictionary containing historical stock data.
 
     Returns:
-    None
+    go.Figure: The rendered volume figure (also useful for replaying cached renders).
     """
-    fig_volume = go.Figure()
-    for ticker, hist in data.items():
-        fig_volume.add_trace(go.Bar(x=hist.index, y=hist['Volume'], name=ticker, marker_color=None))
+    # Hand Plotly ndarrays and all traces at once: per-trace Series coercion
+    # and repeated add_trace calls dominate serialization for many tickers.
+    traces = [
+        go.Bar(x=hist.index.values, y=hist['Volume'].to_numpy(), name=ticker)
+        for ticker, hist in data.items()
+    ]
+    fig_volume = go.Figure(data=traces)
     fig_volume.update_layout(barmode='stack', title="Trading Volume Comparison", xaxis_title="Date", yaxis_title="Volume", template="plotly_white", margin=dict(l=40, r=40, t=40, b=20))
     st.plotly_chart(fig_volume, use_container_width=True)
+    return fig_volume
 
 
-def add_macd_chart(data: Dict[str, Any], add_macd) -> None:
+def add_macd_chart(data: Dict[str, Any], add_macd_many) -> go.Figure:
     """
     Create a MACD chart using the provided data.
 
     Parameters:
     data (dict): A dictionary containing historical stock data.
-    add_macd (function): A function to calculate MACD.
+    add_macd_many (function): A function to calculate MACD for many tickers.
 
     Returns:
-    None
+    go.Figure: The rendered MACD figure.
     """
-    fig_macd = go.Figure()
+    computed = _memo_many(data, 'macd', add_macd_many)
+    traces = []
     for ticker, hist in data.items():
-        macd, signal = add_macd(hist)
-        fig_macd.add_trace(go.Scatter(x=hist.index, y=macd, mode='lines', name=f"{ticker} MACD"))
-        fig_macd.add_trace(go.Scatter(x=hist.index, y=signal, mode='lines', name=f"{ticker} Signal"))
+        macd, signal = computed[ticker]
+        x = hist.index.values
+        traces.append(go.Scatter(x=x, y=macd.to_numpy(), mode='lines', name=f"{ticker} MACD"))
+        traces.append(go.Scatter(x=x, y=signal.to_numpy(), mode='lines', name=f"{ticker} Signal"))
+    fig_macd = go.Figure(data=traces)
     fig_macd.update_layout(title="MACD Comparison", xaxis_title="Date", yaxis_title="MACD", template="plotly_white", margin=dict(l=40, r=40, t=40, b=20))
     st.plotly_chart(fig_macd, use_container_width=True)
+    return fig_macd
 
 
-def add_rsi_chart(data: Dict[str, Any], add_rsi) -> None:
+def add_rsi_chart(data: Dict[str, Any], add_rsi_many) -> go.Figure:
     """
     Create an RSI chart using the provided data.
 
     Parameters:
     data (dict): A dictionary containing historical stock data.
-    add_rsi (function): A function to calculate RSI.
+    add_rsi_many (function): A function to calculate RSI for many tickers.
 
     Returns:
-    None
+    go.Figure: The rendered RSI figure.
     """
-    fig_rsi = go.Figure()
-    for ticker, hist in data.items():
-        fig_rsi.add_trace(go.Scatter(x=hist.index, y=add_rsi(hist, 14), mode='lines', name=f"{ticker} RSI(14)"))
+    computed = _memo_many(data, 'rsi14', lambda pending: add_rsi_many(pending, 14))
+    traces = [
+        go.Scatter(x=hist.index.values, y=computed[ticker].to_numpy(),
+                   mode='lines', name=f"{ticker} RSI(14)")
+        for ticker, hist in data.items()
+    ]
+    fig_rsi = go.Figure(data=traces)
     fig_rsi.update_layout(title="RSI (14) Comparison", xaxis_title="Date", yaxis_title="RSI", template="plotly_white", margin=dict(l=40, r=40, t=40, b=20), yaxis=dict(range=[0, 100]))
     st.plotly_chart(fig_rsi, use_container_width=True)
+    return fig_rsi
+
+
+def _overlay_sma(traces: List[Any], ticker: str, x: np.ndarray, series: Any) -> None:
+    traces.append(go.Scatter(x=x, y=series.to_numpy(), mode='lines', name=f"{ticker} SMA(20)", line=dict(dash='dash')))
+
+
+def _overlay_ema(traces: List[Any], ticker: str, x: np.ndarray, series: Any) -> None:
+    traces.append(go.Scatter(x=x, y=series.to_numpy(), mode='lines', name=f"{ticker} EMA(20)", line=dict(dash='dot')))
+
+
+def _overlay_bollinger(traces: List[Any], ticker: str, x: np.ndarray, bands: Any) -> None:
+    upper, lower = bands
+    traces.append(go.Scatter(x=x, y=upper.to_numpy(), mode='lines', name=f"{ticker} Bollinger Upper", line=dict(color='rgba(0,100,200,0.3)', dash='dot')))
+    traces.append(go.Scatter(x=x, y=lower.to_numpy(), mode='lines', name=f"{ticker} Bollinger Lower", line=dict(color='rgba(200,100,0,0.3)', dash='dot')))
+
+
+def _overlay_stochastic(traces: List[Any], ticker: str, x: np.ndarray, kd: Any) -> None:
+    k, d = kd
+    traces.append(go.Scatter(x=x, y=k.to_numpy(), mode='lines', name=f"{ticker} %K"))
+    traces.append(go.Scatter(x=x, y=d.to_numpy(), mode='lines', name=f"{ticker} %D"))
+
+
+def _overlay_atr(traces: List[Any], ticker: str, x: np.ndarray, series: Any) -> None:
+    traces.append(go.Scatter(x=x, y=series.to_numpy(), mode='lines', name=f"{ticker} ATR(14)", line=dict(dash='dot')))
+
+
+def _overlay_vwap(traces: List[Any], ticker: str, x: np.ndarray, series: Any) -> None:
+    traces.append(go.Scatter(x=x, y=series.to_numpy(), mode='lines', name=f"{ticker} VWAP", line=dict(dash='dash')))
+
+
+def _overlay_ichimoku(traces: List[Any], ticker: str, x: np.ndarray, ichimoku: Any) -> None:
+    traces.append(go.Scatter(x=x, y=ichimoku['tenkan_sen'].to_numpy(), mode='lines', name=f"{ticker} Tenkan-sen"))
+    traces.append(go.Scatter(x=x, y=ichimoku['kijun_sen'].to_numpy(), mode='lines', name=f"{ticker} Kijun-sen"))
+    traces.append(go.Scatter(x=x, y=ichimoku['senkou_span_a'].to_numpy(), mode='lines', name=f"{ticker} Senkou Span A"))
+    traces.append(go.Scatter(x=x, y=ichimoku['senkou_span_b'].to_numpy(), mode='lines', name=f"{ticker} Senkou Span B"))
+    traces.append(go.Scatter(x=x, y=ichimoku['chikou_span'].to_numpy(), mode='lines', name=f"{ticker} Chikou Span"))
+
+
+def _overlay_user(traces: List[Any], ticker: str, x: np.ndarray, series: Any) -> None:
+    traces.append(go.Scatter(x=x, y=series.to_numpy(), mode='lines', name=f"{ticker} Custom Overlay", line=dict(dash='dot')))
+
+
+# Overlay renderers keyed by indicator name: the name is resolved once per
+# chart instead of re-testing the same string for every ticker in the loop.
+_OVERLAY_RENDERERS = {
+    "SMA (20)": _overlay_sma,
+    "EMA (20)": _overlay_ema,
+    "Bollinger Bands (20)": _overlay_bollinger,
+    "Stochastic Oscillator (14,3)": _overlay_stochastic,
+    "ATR (14)": _overlay_atr,
+    "VWAP": _overlay_vwap,
+    "Ichimoku Cloud": _overlay_ichimoku,
+    "User-Defined": _overlay_user,
+}
 
 
 def create_price_chart(data: Dict[str, Any], chart_type: str, indicator: str, overlay: str, start_date: str, end_date: str,
                        add_sma, add_ema, add_bollinger, add_stochastic, add_atr, add_vwap, add_ichimoku, add_user_indicator,
-                       get_stock_events) -> None:
+                       get_stock_events_many) -> go.Figure:
     """
     Create a price chart with various indicators and overlays.
 
@@ -79,7 +225,7 @@ def create_price_chart(data: Dict[str, Any], chart_type: str, indicator: str, ov
     add_vwap (function): A function to calculate Volume Weighted Average Price.
     add_ichimoku (function): A function to calculate Ichimoku Cloud.
     add_user_indicator (function): A function to calculate user-defined indicators.
-    get_stock_events (function): A function to retrieve stock events.
+    get_stock_events_many (function): A function to retrieve stock events for many tickers.
     end_date (str): The end date for the chart.
     add_sma (function): A function to calculate Simple Moving Average.
     add_ema (function): A function to calculate Exponential Moving Average.
@@ -89,84 +235,104 @@ def create_price_chart(data: Dict[str, Any], chart_type: str, indicator: str, ov
     add_vwap (function): A function to calculate Volume Weighted Average Price.
     add_ichimoku (function): A function to calculate Ichimoku Cloud.
     add_user_indicator (function): A function to calculate user-defined indicators.
-    get_stock_events (function): A function to retrieve stock events.
+    get_stock_events_many (function): A function to retrieve stock events for many tickers.
 
     Returns:
-    None
+    go.Figure: The rendered price figure.
     """
+    # Compute the selected indicator once per ticker up front, so the trace
+    # loop below is pure plotting and no series is ever computed twice.
+    computed: Dict[str, Any] = {}
+    if indicator == "SMA (20)":
+        computed = {tk: _memo_series(tk, h, 'sma20', lambda h=h: add_sma(h, 20)) for tk, h in data.items()}
+    elif indicator == "EMA (20)":
+        computed = {tk: _memo_series(tk, h, 'ema20', lambda h=h: add_ema(h, 20)) for tk, h in data.items()}
+    elif indicator == "Bollinger Bands (20)":
+        computed = {tk: _memo_series(tk, h, 'bbands20', lambda h=h: add_bollinger(h, 20)) for tk, h in data.items()}
+    elif indicator == "Stochastic Oscillator (14,3)":
+        computed = {tk: _memo_series(tk, h, 'stoch14_3', lambda h=h: add_stochastic(h, 14, 3)) for tk, h in data.items()}
+    elif indicator == "ATR (14)":
+        computed = {tk: _memo_series(tk, h, 'atr14', lambda h=h: add_atr(h, 14)) for tk, h in data.items()}
+    elif indicator == "VWAP":
+        computed = {tk: _memo_series(tk, h, 'vwap', lambda h=h: add_vwap(h)) for tk, h in data.items()}
+    elif indicator == "Ichimoku Cloud":
+        computed = {tk: _memo_series(tk, h, 'ichimoku', lambda h=h: add_ichimoku(h)) for tk, h in data.items()}
+    elif indicator == "User-Defined" and overlay:
+        computed = {tk: _memo_series(tk, h, f'user:{overlay}', lambda h=h: add_user_indicator(h, overlay)) for tk, h in data.items()}
+
+    render_overlay = _OVERLAY_RENDERERS.get(indicator)
     fig_price = go.Figure()
+    traces = []
+    shapes = []
+    annotations = []
+    # Converted once; the per-ticker loop reuses the same Timestamps.
+    start_ts = pd.to_datetime(start_date)
+    end_ts = pd.to_datetime(end_date)
+    # One concurrent fan-out for every ticker's events before the loop.
+    events_by_ticker = get_stock_events_many(list(data), start_ts, end_ts)
     for ticker, hist in data.items():
-        events = get_stock_events(ticker, pd.to_datetime(start_date), pd.to_datetime(end_date))
-        # Chart type
+        events = events_by_ticker.get(ticker)
+        # ndarrays once per ticker; Plotly then serializes without coercing
+        # pandas objects per trace.
+        x = hist.index.values
+        close_y = hist['Close'].to_numpy()
+        # Chart type. Line/Area render through WebGL (Scattergl) with LTTB
+        # decimation for long series; candlesticks stay full-resolution since
+        # OHLC bars can't be meaningfully downsampled point-by-point.
         if chart_type == "Line":
-            fig_price.add_trace(go.Scatter(x=hist.index, y=hist['Close'], mode='lines', name=ticker))
+            xd, yd = _decimate(x, close_y)
+            traces.append(go.Scattergl(x=xd, y=yd, mode='lines', name=ticker))
         elif chart_type == "Area":
-            fig_price.add_trace(go.Scatter(x=hist.index, y=hist['Close'], mode='lines', name=ticker, fill='tozeroy'))
+            xd, yd = _decimate(x, close_y)
+            traces.append(go.Scattergl(x=xd, y=yd, mode='lines', name=ticker, fill='tozeroy'))
         elif chart_type == "Candlestick":
             if {'Open', 'High', 'Low', 'Close'}.issubset(hist.columns):
-                fig_price.add_trace(go.Candlestick(x=hist.index, open=hist['Open'], high=hist['High'], low=hist['Low'], close=hist['Close'], name=ticker))
-        # Indicator overlays
-        if indicator == "SMA (20)":
-            fig_price.add_trace(go.Scatter(x=hist.index, y=add_sma(hist, 20), mode='lines', name=f"{ticker} SMA(20)", line=dict(dash='dash')))
-        elif indicator == "EMA (20)":
-            fig_price.add_trace(go.Scatter(x=hist.index, y=add_ema(hist, 20), mode='lines', name=f"{ticker} EMA(20)", line=dict(dash='dot')))
-        elif indicator == "Bollinger Bands (20)":
-            upper, lower = add_bollinger(hist, 20)
-            fig_price.add_trace(go.Scatter(x=hist.index, y=upper, mode='lines', name=f"{ticker} Bollinger Upper", line=dict(color='rgba(0,100,200,0.3)', dash='dot')))
-            fig_price.add_trace(go.Scatter(x=hist.index, y=lower, mode='lines', name=f"{ticker} Bollinger Lower", line=dict(color='rgba(200,100,0,0.3)', dash='dot')))
-        elif indicator == "Stochastic Oscillator (14,3)":
-            k, d = add_stochastic(hist, 14, 3)
-            fig_price.add_trace(go.Scatter(x=hist.index, y=k, mode='lines', name=f"{ticker} %K"))
-            fig_price.add_trace(go.Scatter(x=hist.index, y=d, mode='lines', name=f"{ticker} %D"))
-        elif indicator == "ATR (14)":
-            atr = add_atr(hist, 14)
-            fig_price.add_trace(go.Scatter(x=hist.index, y=atr, mode='lines', name=f"{ticker} ATR(14)", line=dict(dash='dot')))
-        elif indicator == "VWAP":
-            vwap = add_vwap(hist)
-            fig_price.add_trace(go.Scatter(x=hist.index, y=vwap, mode='lines', name=f"{ticker} VWAP", line=dict(dash='dash')))
-        elif indicator == "Ichimoku Cloud":
-            ichimoku = add_ichimoku(hist)
-            fig_price.add_trace(go.Scatter(x=hist.index, y=ichimoku['tenkan_sen'], mode='lines', name=f"{ticker} Tenkan-sen"))
-            fig_price.add_trace(go.Scatter(x=hist.index, y=ichimoku['kijun_sen'], mode='lines', name=f"{ticker} Kijun-sen"))
-            fig_price.add_trace(go.Scatter(x=hist.index, y=ichimoku['senkou_span_a'], mode='lines', name=f"{ticker} Senkou Span A"))
-            fig_price.add_trace(go.Scatter(x=hist.index, y=ichimoku['senkou_span_b'], mode='lines', name=f"{ticker} Senkou Span B"))
-            fig_price.add_trace(go.Scatter(x=hist.index, y=ichimoku['chikou_span'], mode='lines', name=f"{ticker} Chikou Span"))
-        elif indicator == "User-Defined" and overlay:
-            user_series = add_user_indicator(hist, overlay)
-            if user_series is not None:
-                fig_price.add_trace(go.Scatter(x=hist.index, y=user_series, mode='lines', name=f"{ticker} Custom Overlay", line=dict(dash='dot')))
-        
-        # --- Add event markers (annotations) ---
-        for event in events:
-            fig_price.add_shape(
-                type="line",
-                x0=event['date'], x1=event['date'],
-                y0=hist['Close'].min(), y1=hist['Close'].max(),
-                line=dict(color="red" if event['type']=="Earnings" else "blue", width=1, dash="dot"),
-                xref="x", yref="y"
-            )
-            fig_price.add_annotation(
-                x=event['date'],
-                y=hist['Close'].max(),
-                text=event['type'],
-                showarrow=True,
-                arrowhead=2,
-                ax=0,
-                ay=-40,
-                bgcolor="white",
-                bordercolor="black",
-                font=dict(size=10, color="black"),
-                hovertext=event['desc'],
-                hoverlabel=dict(bgcolor="white")
-            )
+                traces.append(go.Candlestick(x=x, open=hist['Open'].to_numpy(), high=hist['High'].to_numpy(), low=hist['Low'].to_numpy(), close=close_y, name=ticker))
+        # Indicator overlay (renderer resolved once, series precomputed above)
+        if render_overlay is not None:
+            value = computed.get(ticker)
+            if value is not None:
+                render_overlay(traces, ticker, x, value)
+
+
+        # --- Collect event markers; emitted in one layout update below ---
+        if events is not None and len(events):
+            y_min = close_y.min()
+            y_max = close_y.max()
+            for event in events.itertuples(index=False):
+                shapes.append(dict(
+                    type="line",
+                    x0=event.date, x1=event.date,
+                    y0=y_min, y1=y_max,
+                    line=dict(color="red" if event.type == "Earnings" else "blue", width=1, dash="dot"),
+                    xref="x", yref="y"
+                ))
+                annotations.append(dict(
+                    x=event.date,
+                    y=y_max,
+                    text=event.type,
+                    showarrow=True,
+                    arrowhead=2,
+                    ax=0,
+                    ay=-40,
+                    bgcolor="white",
+                    bordercolor="black",
+                    font=dict(size=10, color="black"),
+                    hovertext=event.desc,
+                    hoverlabel=dict(bgcolor="white")
+                ))
+    fig_price.add_traces(traces)
     fig_price.update_layout(
         title="Closing Prices & Indicator Overlays (Multi-Timeframe)",
         xaxis_title="Date",
         yaxis_title="Price (USD)",
         template="plotly_white",
-        margin=dict(l=40, r=40, t=40, b=20)
+        margin=dict(l=40, r=40, t=40, b=20),
+        shapes=shapes,
+        annotations=annotations
     )
     st.plotly_chart(fig_price, use_container_width=True)
+    return fig_price
 
 def display_key_metrics(data: Dict[str, Any], lang: str, t, timeframe: str, live_ticker, live_volume) -> pd.DataFrame:
     """
@@ -186,30 +352,52 @@ def display_key_metrics(data: Dict[str, Any], lang: str, t, timeframe: str, live
     # --- Live Ticker & Volume Display ---
     if timeframe == "Intraday":
         ticker_info = []
+        volume_info = []
         for ticker, hist in data.items():
-            last_row = hist.iloc[-1]
-            price = last_row['Close']
-            volume = last_row['Volume']
+            # .iat is the positional scalar fast path; avoids materializing a
+            # full row Series just to read two fields every refresh.
+            price = hist['Close'].iat[-1]
+            volume = hist['Volume'].iat[-1]
             ticker_info.append(f"{ticker}: ${price:,.2f} | Vol: {volume:,}")
+            volume_info.append(f"{ticker}: {volume:,}")
         live_ticker.markdown("**Live Prices:**<br>" + "<br>".join(ticker_info), unsafe_allow_html=True)
-        live_volume.markdown("**Streaming Volume:**<br>" + "<br>".join([f"{ticker}: {hist.iloc[-1]['Volume']:,}" for ticker, hist in data.items()]), unsafe_allow_html=True)
+        live_volume.markdown("**Streaming Volume:**<br>" + "<br>".join(volume_info), unsafe_allow_html=True)
     
     # --- Key Metrics Table ---
     st.subheader(t("key_metrics", lang))
-    metrics = []
-    for ticker, hist in data.items():
-        current_close = hist['Close'][-1]
-        start_close = hist['Close'][0]
-        pct_change = ((current_close - start_close) / start_close) * 100
-        high = hist['Close'].max()
-        low = hist['Close'].min()
-        metrics.append({
-            t("current_close", lang): f"${current_close:,.2f}",
-            t("pct_change", lang): f"{pct_change:.2f}%",
-            t("high_low", lang): f"${high:,.2f} / ${low:,.2f}",
-            "Ticker": ticker
-        })
-    metrics_df = pd.DataFrame(metrics)
-    st.dataframe(metrics_df)
+    n = len(data)
+    closes = np.empty(n)
+    pcts = np.empty(n)
+    highs = np.empty(n)
+    lows = np.empty(n)
+    for i, hist in enumerate(data.values()):
+        # One positional NumPy pass per ticker; avoids label-based __getitem__
+        # on every access, which adds up across the 10 s autorefresh.
+        close = hist['Close'].to_numpy(np.float64, copy=False)
+        if NUMBA_AVAILABLE:
+            # Single fused sweep for first/last/high/low instead of two
+            # separate reductions plus two scalar reads.
+            first, last, hi, lo = _close_stats(close)
+        else:
+            first, last, hi, lo = close[0], close[-1], close.max(), close.min()
+        closes[i] = last
+        pcts[i] = ((last - first) / first) * 100
+        highs[i] = hi
+        lows[i] = lo
+    # Keep the DataFrame numeric and defer currency/percent formatting to the
+    # display layer, instead of f-string formatting every cell per rerun.
+    metrics_df = pd.DataFrame({
+        "Ticker": list(data),
+        t("current_close", lang): closes,
+        t("pct_change", lang): pcts,
+        t("high", lang): highs,
+        t("low", lang): lows
+    })
+    st.dataframe(metrics_df.style.format({
+        t("current_close", lang): "${:,.2f}",
+        t("pct_change", lang): "{:.2f}%",
+        t("high", lang): "${:,.2f}",
+        t("low", lang): "${:,.2f}"
+    }))
 
     return metrics_df